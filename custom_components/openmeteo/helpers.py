@@ -2,7 +2,8 @@
 """Helper utilities for Open-Meteo integration."""
 from __future__ import annotations
 
-from typing import Any, Iterable, Optional, Sequence
+from bisect import bisect_left
+from typing import Any, Callable, Iterable, Optional, Sequence
 
 from homeassistant.core import HomeAssistant
 from homeassistant.config_entries import ConfigEntry
@@ -296,8 +297,72 @@ async def async_prefer_user_zip_postcode(
     return await async_best_effort_postcode_cached(hass, latf, lonf, language=language)
 
 
-def hourly_index_at_now(data: dict) -> Optional[int]:
-    """Return the index in hourly['time'] that matches the current hour (exact or nearest)."""
+def _hourly_grid_index(times: Sequence[str], tz, now) -> Optional[int]:
+    """Compute the index of `now` from times[0], assuming a contiguous 1-hour grid.
+
+    Returns None when the grid assumption does not hold or the computed slot
+    does not match `now` exactly, so the caller can fall back to a scan.
+    """
+    if len(times) < 2:
+        return None
+    t0 = _parse_hour(times[0], tz)
+    t1 = _parse_hour(times[1], tz)
+    if t0 is None or t1 is None or (t1 - t0).total_seconds() != 3600:
+        return None
+
+    idx = int((now - t0).total_seconds() // 3600)
+    if not 0 <= idx < len(times):
+        return None
+    if _parse_hour(times[idx], tz) != now:
+        return None
+    return idx
+
+
+def hourly_epochs(data: dict) -> tuple[list[float], list[int]]:
+    """Parse hourly['time'] into sorted epoch seconds and their source indices.
+
+    Unparseable timestamps are skipped. The result can be computed once per
+    payload and passed to hourly_index_at_now to avoid re-parsing.
+    """
+    hourly = (data.get("hourly") or {}) if isinstance(data, dict) else {}
+    times: Iterable[str] = hourly.get("time") or []
+    tz = dt_util.get_time_zone(data.get("timezone")) or dt_util.UTC
+    pairs: list[tuple[float, int]] = []
+    for idx, t in enumerate(times):
+        dt_hr = _parse_hour(t, tz)
+        if dt_hr is not None:
+            pairs.append((dt_hr.timestamp(), idx))
+    pairs.sort()
+    return [ts for ts, _ in pairs], [idx for _, idx in pairs]
+
+
+def _nearest_epoch_index(
+    epochs: list[float], indices: list[int], now_ts: float
+) -> Optional[int]:
+    """Return the source index whose epoch is closest to `now_ts` (earlier wins ties)."""
+    if not epochs:
+        return None
+    pos = bisect_left(epochs, now_ts)
+    if pos == len(epochs):
+        return indices[-1]
+    if epochs[pos] == now_ts or pos == 0:
+        return indices[pos]
+    if now_ts - epochs[pos - 1] <= epochs[pos] - now_ts:
+        return indices[pos - 1]
+    return indices[pos]
+
+
+def hourly_index_at_now(
+    data: dict,
+    epochs: tuple[list[float], list[int]]
+    | Callable[[], tuple[list[float], list[int]]]
+    | None = None,
+) -> Optional[int]:
+    """Return the index in hourly['time'] that matches the current hour (exact or nearest).
+
+    `epochs` may be a cached hourly_epochs(data) result for the same payload, or
+    a callable returning one; it is only used when the 1-hour grid shortcut fails.
+    """
     if not isinstance(data, dict):
         return None
 
@@ -305,25 +370,21 @@ def hourly_index_at_now(data: dict) -> Optional[int]:
     times: Iterable[str] = hourly.get("time") or []
     if not times:
         return None
+    if not isinstance(times, Sequence):
+        times = list(times)
 
     tz = dt_util.get_time_zone(data.get("timezone")) or dt_util.UTC
     now = dt_util.now(tz).replace(minute=0, second=0, microsecond=0)
 
-    best_idx = None
-    best_diff = None
+    idx = _hourly_grid_index(times, tz, now)
+    if idx is not None:
+        return idx
 
-    for idx, t in enumerate(times):
-        dt_hr = _parse_hour(t, tz)
-        if dt_hr is None:
-            continue
-        if dt_hr == now:
-            return idx
-        diff = abs((dt_hr - now).total_seconds())
-        if best_diff is None or diff < best_diff:
-            best_diff = diff
-            best_idx = idx
-
-    return best_idx
+    if epochs is None:
+        epochs = hourly_epochs(data)
+    elif callable(epochs):
+        epochs = epochs()
+    return _nearest_epoch_index(epochs[0], epochs[1], now.timestamp())
 
 
 def hourly_at_now(data: dict, key: str) -> Any:
@@ -40,8 +40,8 @@ from .helpers import (
     aq_hour_value as _aq_hour_value,
 )
 from .runtime import (
+    EntryStore,
     get_entry_coordinator,
-    get_entry_runtime_store,
     get_or_create_entry_runtime_store,
 )
 from .naming import default_device_name, stable_sensor_unique_id
@@ -539,6 +539,7 @@ class OpenMeteoSensor(CoordinatorEntity[OpenMeteoDataUpdateCoordinator], SensorE
         super().__init__(coordinator)
         self._sensor_type = sensor_type
         self._config_entry = config_entry
+        self._store: EntryStore | None = None
         self.entity_description = SENSOR_TYPES[sensor_type]
         self._value_fn = self.entity_description.value_fn
 
@@ -586,13 +587,8 @@ class OpenMeteoSensor(CoordinatorEntity[OpenMeteoDataUpdateCoordinator], SensorE
     @property
     def extra_state_attributes(self):
         attrs = _extra_attrs(self.coordinator.data or {})
-        try:
-            store = get_entry_runtime_store(self.hass, self._config_entry.entry_id) or {}
-            src = store.get("src")
-            if src:
-                attrs["source"] = src
-        except Exception:  # pylint: disable=broad-except
-            pass
+        if self._store and (src := self._store.get("src")):
+            attrs["source"] = src
         return attrs
 
     def _handle_place_update(self, *_) -> None:
@@ -602,14 +598,13 @@ class OpenMeteoSensor(CoordinatorEntity[OpenMeteoDataUpdateCoordinator], SensorE
     async def async_added_to_hass(self) -> None:
         """When entity is added to hass."""
         await super().async_added_to_hass()
-        store = get_or_create_entry_runtime_store(self.hass, self._config_entry.entry_id)
-        store.setdefault("entities", []).append(self)
+        self._store = get_or_create_entry_runtime_store(self.hass, self._config_entry.entry_id)
+        self._store.setdefault("entities", set()).add(self)
 
     async def async_will_remove_from_hass(self) -> None:
         """Run when entity will be removed from hass."""
-        store = get_entry_runtime_store(self.hass, self._config_entry.entry_id)
-        if store and self in store.get("entities", []):
-            store["entities"].remove(self)
+        if self._store is not None and "entities" in self._store:
+            self._store["entities"].discard(self)
         await super().async_will_remove_from_hass()
 
 
@@ -623,6 +618,7 @@ class OpenMeteoUvIndexSensor(CoordinatorEntity[OpenMeteoDataUpdateCoordinator],
     ) -> None:
         super().__init__(coordinator)
         self._config_entry = config_entry
+        self._store: EntryStore | None = None
 
         # Set entity attributes
         # Ważne: has_entity_name=False, aby entity_id było "sensor.promieniowanie_uv" bez prefiksu miejscowości
@@ -670,13 +666,12 @@ class OpenMeteoUvIndexSensor(CoordinatorEntity[OpenMeteoDataUpdateCoordinator],
             async_dispatcher_connect(self.hass, signal, self._handle_place_update)
         )
         self._handle_place_update()
-        store = get_or_create_entry_runtime_store(self.hass, self._config_entry.entry_id)
-        store.setdefault("entities", []).append(self)
+        self._store = get_or_create_entry_runtime_store(self.hass, self._config_entry.entry_id)
+        self._store.setdefault("entities", set()).add(self)
 
     async def async_will_remove_from_hass(self) -> None:
-        store = get_entry_runtime_store(self.hass, self._config_entry.entry_id)
-        if store and self in store.get("entities", []):
-            store["entities"].remove(self)
+        if self._store is not None and "entities" in self._store:
+            self._store["entities"].discard(self)
         await super().async_will_remove_from_hass()
 
     @callback
@@ -697,6 +692,7 @@ class OpenMeteoAqSensor(CoordinatorEntity[OpenMeteoDataUpdateCoordinator], Senso
         super().__init__(coordinator)
         self._sensor_type = sensor_type
         self._config_entry = config_entry
+        self._store: EntryStore | None = None
         self.entity_description = AQ_SENSORS[sensor_type]
         
         # Set entity attributes
@@ -759,12 +755,11 @@ class OpenMeteoAqSensor(CoordinatorEntity[OpenMeteoDataUpdateCoordinator], Senso
     async def async_added_to_hass(self) -> None:
         """When entity is added to hass."""
         await super().async_added_to_hass()
-        store = get_or_create_entry_runtime_store(self.hass, self._config_entry.entry_id)
-        store.setdefault("entities", []).append(self)
+        self._store = get_or_create_entry_runtime_store(self.hass, self._config_entry.entry_id)
+        self._store.setdefault("entities", set()).add(self)
 
     async def async_will_remove_from_hass(self) -> None:
         """Run when entity will be removed from hass."""
-        store = get_entry_runtime_store(self.hass, self._config_entry.entry_id)
-        if store and self in store.get("entities", []):
-            store["entities"].remove(self)
+        if self._store is not None and "entities" in self._store:
+            self._store["entities"].discard(self)
         await super().async_will_remove_from_hass()
@@ -3,6 +3,8 @@ from __future__ import annotations
 
 import logging
 from datetime import datetime
+from functools import lru_cache
+from itertools import islice, zip_longest
 from typing import Any
 
 from homeassistant.components.weather import (
@@ -52,7 +54,7 @@ from .const import (
 )
 from .coordinator import OpenMeteoDataUpdateCoordinator
 from .helpers import (
-    hourly_at_now as _hourly_at_now,
+    hourly_epochs as _hourly_epochs,
     hourly_index_at_now as _hourly_index_at_now,
     maybe_update_device_name,
 )
@@ -200,16 +202,63 @@ async def async_migrate_weather_entry(
     return True
 
 
+# WMO weather codes are small ints (0-99); index a flat table instead of hashing
+# into CONDITION_MAP for every forecast row.
+_CONDITION_LUT: list[str | None] = [CONDITION_MAP.get(code) for code in range(100)]
+
+
 def _map_condition(weather_code: int | None, is_day: int | None = 1) -> str | None:
     """Map Open-Meteo weather code to Home Assistant condition."""
 
     if weather_code is None:
         return None
+    return _map_condition_cached(weather_code, is_day)
+
+
+@lru_cache(maxsize=128)
+def _map_condition_cached(weather_code: int, is_day: int | None) -> str | None:
+    """Memoized body of _map_condition; (code, is_day) has only a few hundred values."""
+
     if weather_code in (0, 1) and is_day == 0:
         return "clear-night"
+    if isinstance(weather_code, int) and 0 <= weather_code < 100:
+        return _CONDITION_LUT[weather_code]
     return CONDITION_MAP.get(weather_code)
 
 
+def _pick(values: list[Any], idx: int) -> Any:
+    """Return values[idx], or None when the array is too short."""
+    return values[idx] if idx < len(values) else None
+
+
+# Key order matches the row tuples assembled in _map_daily_forecast.
+_DAILY_KEYS: tuple[str, ...] = (
+    ATTR_FORECAST_TIME,
+    ATTR_FORECAST_TEMP,
+    ATTR_FORECAST_TEMP_LOW,
+    ATTR_FORECAST_CONDITION,
+    ATTR_FORECAST_PRECIPITATION,
+    ATTR_FORECAST_WIND_SPEED,
+    ATTR_FORECAST_WIND_BEARING,
+    ATTR_FORECAST_PRECIPITATION_PROBABILITY,
+)
+
+
+# (forecast key, Open-Meteo hourly variable) pairs for async_forecast_hourly.
+_HOURLY_FIELD_MAP: tuple[tuple[str, str], ...] = (
+    ("temperature", "temperature_2m"),
+    ("dew_point", "dewpoint_2m"),
+    ("humidity", "relative_humidity_2m"),
+    ("pressure", "pressure_msl"),
+    ("wind_speed", "wind_speed_10m"),
+    ("wind_bearing", "wind_direction_10m"),
+    ("wind_gust_speed", "wind_gusts_10m"),
+    ("precipitation", "precipitation"),
+    ("precipitation_probability", "precipitation_probability"),
+    ("cloud_coverage", "cloud_cover"),
+)
+
+
 class OpenMeteoWeather(CoordinatorEntity[OpenMeteoDataUpdateCoordinator], WeatherEntity):
     """Representation of the Open-Meteo weather entity."""
 
@@ -257,6 +306,76 @@ class OpenMeteoWeather(CoordinatorEntity[OpenMeteoDataUpdateCoordinator], Weathe
             data.get(CONF_MIN_TRACK_INTERVAL, DEFAULT_MIN_TRACK_INTERVAL)
         )
         self._provider = coordinator.provider
+        self._area_override = data.get(CONF_AREA_NAME_OVERRIDE)
+        self._fallback_label_key: tuple[Any, Any] | None = None
+        self._fallback_label: str | None = None
+        self._current_weather: dict[str, Any] = {}
+        self._current: dict[str, Any] = {}
+        self._daily: dict[str, Any] = {}
+        self._hourly: dict[str, list[Any]] = {}
+        self._data: dict[str, Any] = {}
+        self._hour_idx_cache: tuple[int, int | None] | None = None
+        self._daily_cache: list[dict[str, Any]] | None = None
+        self._hourly_cache: tuple[int, list[dict[str, Any]]] | None = None
+        self._hourly_iso: list[str | None] | None = None
+        self._hourly_epochs: tuple[list[float], list[int]] | None = None
+        self._sun_cache: dict[str, Any] = {}
+        self._tz_cache: tuple[str, Any] | None = None
+        self._cache_coordinator_data()
+
+    def _cache_coordinator_data(self) -> None:
+        """Cache coordinator sections; keep only list-valued hourly arrays."""
+        data = self.coordinator.data or {}
+        self._data = data
+        self._current_weather = data.get("current_weather") or {}
+        self._current = data.get("current") or {}
+        self._daily = data.get("daily") or {}
+        hourly = data.get("hourly") or {}
+        self._hourly = {key: val for key, val in hourly.items() if isinstance(val, list)}
+        self._hour_idx_cache = None
+        self._daily_cache = None
+        self._hourly_cache = None
+        self._hourly_iso = None
+        self._hourly_epochs = None
+        self._sun_cache = {}
+
+    def _hour_index(self) -> int | None:
+        """Return the current hourly index, memoized per coordinator update.
+
+        The cache is also keyed on a 15-minute wall-clock slot so the index
+        still advances between refreshes, including in zones with :30/:45 offsets.
+        """
+        slot = int(dt_util.utcnow().timestamp() // 900)
+        cached = self._hour_idx_cache
+        if cached is not None and cached[0] == slot:
+            return cached[1]
+        idx = _hourly_index_at_now(self._data, self._epochs)
+        self._hour_idx_cache = (slot, idx)
+        return idx
+
+    def _epochs(self) -> tuple[list[float], list[int]]:
+        """Return parsed hourly epochs, built on first use per coordinator update."""
+        if self._hourly_epochs is None:
+            self._hourly_epochs = _hourly_epochs(self._data)
+        return self._hourly_epochs
+
+    def _hourly_value(self, key: str) -> Any:
+        """Return the hourly value of `key` for the current hour."""
+        arr = self._hourly.get(key)
+        if not arr:
+            return None
+        idx = self._hour_index()
+        return _pick(arr, idx) if idx is not None else None
+
+    def _hourly_iso_times(self) -> list[str | None]:
+        """Return localized ISO hourly timestamps, parsed once per coordinator update."""
+        if self._hourly_iso is None:
+            iso: list[str | None] = []
+            for ts in self._hourly.get("time", []):
+                dt = dt_util.parse_datetime(ts)
+                iso.append(dt_util.as_local(dt).isoformat() if dt else None)
+            self._hourly_iso = iso
+        return self._hourly_iso
 
     def _default_device_name(self):
         """Deprecated: device name is stable from config_entry.title."""
@@ -285,23 +404,31 @@ class OpenMeteoWeather(CoordinatorEntity[OpenMeteoDataUpdateCoordinator], Weathe
         except Exception as ex:
             _LOGGER.debug("[openmeteo] Device name sync skipped: %s", ex)
 
+    def _coords_fallback_label(self) -> str | None:
+        """Return the coordinate label for the current location, formatted once per change."""
+        location = (self.coordinator.data or {}).get("location") or {}
+        key = (location.get("latitude"), location.get("longitude"))
+        if key != self._fallback_label_key:
+            lat, lon = key
+            self._fallback_label = (
+                coords_label(float(lat), float(lon))
+                if isinstance(lat, (int, float)) and isinstance(lon, (int, float))
+                else None
+            )
+            self._fallback_label_key = key
+        return self._fallback_label
+
     async def _maybe_update_entry_title(self) -> None:
         """Update the Config Entry title to current place (mirrors device name)."""
         loc = (self.coordinator.data or {}).get("location_name")
         new_title = str(loc) if loc else None
         try:
-            fallback = None
-            location = (self.coordinator.data or {}).get("location") or {}
-            lat = location.get("latitude")
-            lon = location.get("longitude")
-            if isinstance(lat, (int, float)) and isinstance(lon, (int, float)):
-                fallback = coords_label(float(lat), float(lon))
-            merged = {**self._config_entry.data, **self._config_entry.options}
+            fallback = self._coords_fallback_label()
             if should_update_entry_title(
                 current_title=self._config_entry.title,
                 new_title=new_title,
                 fallback_label=fallback,
-                area_override=merged.get(CONF_AREA_NAME_OVERRIDE),
+                area_override=self._area_override,
             ):
                 self.coordinator.async_update_entry_no_reload(title=new_title)
         except Exception as ex:
@@ -309,6 +436,8 @@ class OpenMeteoWeather(CoordinatorEntity[OpenMeteoDataUpdateCoordinator], Weathe
 
     async def async_added_to_hass(self) -> None:
         await super().async_added_to_hass()
+        # The coordinator may have refreshed between __init__ and subscription
+        self._cache_coordinator_data()
         self._update_device_name()
         # Ustawiamy przyjazną nazwę po dodaniu, by nie wpływać na entity_id
         self._update_friendly_name()
@@ -342,6 +471,7 @@ class OpenMeteoWeather(CoordinatorEntity[OpenMeteoDataUpdateCoordinator], Weathe
             )
 
     def _handle_coordinator_update(self) -> None:
+        self._cache_coordinator_data()
         self._update_friendly_name()
         self.async_write_ha_state()
         try:
@@ -355,38 +485,40 @@ class OpenMeteoWeather(CoordinatorEntity[OpenMeteoDataUpdateCoordinator], Weathe
     # -------------------------------------------------------------------------
 
     def _map_daily_forecast(self) -> list[dict[str, Any]]:
-        daily = (self.coordinator.data or {}).get("daily") or {}
+        if self._daily_cache is not None:
+            return self._daily_cache
+
+        daily = self._daily
         times = daily.get("time", [])
         if not isinstance(times, list):
             return []
 
-        temp_max = daily.get("temperature_2m_max", [])
-        temp_min = daily.get("temperature_2m_min", [])
-        wcodes = daily.get("weathercode", [])
-        precip_sum = daily.get("precipitation_sum", [])
-        ws_max = daily.get("wind_speed_10m_max", [])
-        wd_dom = daily.get("wind_direction_10m_dominant", [])
-        pop = daily.get("precipitation_probability_max", [])
+        def _arr(key: str) -> list[Any]:
+            val = daily.get(key)
+            return val if isinstance(val, list) else []
+
+        columns = zip_longest(
+            times,
+            _arr("temperature_2m_max"),
+            _arr("temperature_2m_min"),
+            _arr("weathercode"),
+            _arr("precipitation_sum"),
+            _arr("wind_speed_10m_max"),
+            _arr("wind_direction_10m_dominant"),
+            _arr("precipitation_probability_max"),
+        )
 
         result: list[dict[str, Any]] = []
-        for idx, dt in enumerate(times):
-            forecast = {
-                ATTR_FORECAST_TIME: dt,
-                ATTR_FORECAST_TEMP: temp_max[idx] if idx < len(temp_max) else None,
-                ATTR_FORECAST_TEMP_LOW: temp_min[idx] if idx < len(temp_min) else None,
-                ATTR_FORECAST_CONDITION: _map_condition(wcodes[idx])
-                if idx < len(wcodes)
-                else None,
-                ATTR_FORECAST_PRECIPITATION: precip_sum[idx]
-                if idx < len(precip_sum)
-                else None,
-                ATTR_FORECAST_WIND_SPEED: ws_max[idx] if idx < len(ws_max) else None,
-                ATTR_FORECAST_WIND_BEARING: wd_dom[idx] if idx < len(wd_dom) else None,
-                ATTR_FORECAST_PRECIPITATION_PROBABILITY: pop[idx]
-                if idx < len(pop)
-                else None,
-            }
-            result.append(forecast)
+        for dt, tmax, tmin, code, psum, ws_max, wd_dom, pop in islice(columns, len(times)):
+            result.append(
+                dict(
+                    zip(
+                        _DAILY_KEYS,
+                        (dt, tmax, tmin, _map_condition(code), psum, ws_max, wd_dom, pop),
+                    )
+                )
+            )
+        self._daily_cache = result
         return result
 
     # -------------------------------------------------------------------------
@@ -401,51 +533,61 @@ class OpenMeteoWeather(CoordinatorEntity[OpenMeteoDataUpdateCoordinator], Weathe
 
     @property
     def native_temperature(self) -> float | None:
-        current_weather = (self.coordinator.data or {}).get("current_weather", {})
-        temp = current_weather.get("temperature")
-        return round(temp, 1) if isinstance(temp, (int, float)) else None
+        try:
+            return round(self._current_weather.get("temperature"), 1)
+        except TypeError:
+            return None
 
     @property
     def native_pressure(self) -> float | None:
-        val = _hourly_at_now(self.coordinator.data or {}, "pressure_msl")
-        return round(val, 1) if isinstance(val, (int, float)) else None
+        try:
+            return round(self._hourly_value("pressure_msl"), 1)
+        except TypeError:
+            return None
 
     @property
     def native_wind_speed(self) -> float | None:
-        current_weather = (self.coordinator.data or {}).get("current_weather", {})
-        wind_speed = current_weather.get("windspeed")
-        return round(wind_speed, 1) if isinstance(wind_speed, (int, float)) else None
+        try:
+            return round(self._current_weather.get("windspeed"), 1)
+        except TypeError:
+            return None
 
     @property
     def wind_bearing(self) -> float | None:
-        current_weather = (self.coordinator.data or {}).get("current_weather", {})
-        wind_dir = current_weather.get("winddirection")
-        return round(wind_dir, 1) if isinstance(wind_dir, (int, float)) else None
+        try:
+            return round(self._current_weather.get("winddirection"), 1)
+        except TypeError:
+            return None
 
     @property
     def native_visibility(self) -> float | None:
-        visibility = _hourly_at_now(self.coordinator.data or {}, "visibility")
-        return round(visibility / 1000, 2) if isinstance(visibility, (int, float)) else None
+        try:
+            return round(self._hourly_value("visibility") / 1000, 2)
+        except TypeError:
+            return None
 
     @property
     def humidity(self) -> int | None:
-        hum = _hourly_at_now(self.coordinator.data or {}, "relative_humidity_2m")
-        return round(hum) if isinstance(hum, (int, float)) else None
+        try:
+            return round(self._hourly_value("relative_humidity_2m"))
+        except (TypeError, ValueError):
+            return None
 
     @property
     def native_dew_point(self) -> float | None:
-        current = (self.coordinator.data or {}).get("current", {})
-        dew = current.get("dewpoint_2m")
-        if isinstance(dew, (int, float)):
-            return round(dew, 1)
-        val = _hourly_at_now(self.coordinator.data or {}, "dewpoint_2m")
-        return round(val, 1) if isinstance(val, (int, float)) else None
+        try:
+            return round(self._current.get("dewpoint_2m"), 1)
+        except TypeError:
+            pass
+        try:
+            return round(self._hourly_value("dewpoint_2m"), 1)
+        except TypeError:
+            return None
 
     @property
     def condition(self) -> str | None:
-        current_weather = (self.coordinator.data or {}).get("current_weather", {})
-        weather_code = current_weather.get("weathercode")
-        is_day = current_weather.get("is_day")
+        weather_code = self._current_weather.get("weathercode")
+        is_day = self._current_weather.get("is_day")
         return _map_condition(weather_code, is_day)
 
     @property
@@ -456,102 +598,99 @@ class OpenMeteoWeather(CoordinatorEntity[OpenMeteoDataUpdateCoordinator], Weathe
         return self.forecast_daily
 
     async def async_forecast_hourly(self) -> list[dict[str, Any]]:
-        hourly = (self.coordinator.data or {}).get("hourly") or {}
-        times = hourly.get("time") or []
-        if not isinstance(times, list) or not times:
-            _LOGGER.debug("Hourly forecast: 0 entries")
+        hourly = self._hourly
+        times = hourly.get("time")
+        if not times:
+            if _LOGGER.isEnabledFor(logging.DEBUG):
+                _LOGGER.debug("Hourly forecast: 0 entries")
             return []
 
-        start_idx = _hourly_index_at_now(self.coordinator.data or {}) or 0
+        start_idx = self._hour_index() or 0
+        cached = self._hourly_cache
+        if cached is not None and cached[0] == start_idx:
+            return cached[1]
         end_idx = min(len(times), start_idx + 72)
 
+        window = slice(start_idx, end_idx)
+        empty: list[Any] = []
+        columns = [
+            (out_key, hourly.get(src_key, empty)[window])
+            for out_key, src_key in _HOURLY_FIELD_MAP
+        ]
+        wcodes = hourly.get("weathercode", empty)[window]
+        is_day_arr = hourly.get("is_day")
+        is_day_col = is_day_arr[window] if is_day_arr is not None else None
+
         result: list[dict[str, Any]] = []
-        for idx in range(start_idx, end_idx):
-            ts = times[idx]
-            dt = dt_util.parse_datetime(ts)
-            if not dt:
+        for pos, iso in enumerate(self._hourly_iso_times()[window]):
+            if not iso:
                 continue
-            dt_local = dt_util.as_local(dt)
-            item: dict[str, Any] = {"datetime": dt_local.isoformat()}
-            for out_key, src_key in {
-                "temperature": "temperature_2m",
-                "dew_point": "dewpoint_2m",
-                "humidity": "relative_humidity_2m",
-                "pressure": "pressure_msl",
-                "wind_speed": "wind_speed_10m",
-                "wind_bearing": "wind_direction_10m",
-                "wind_gust_speed": "wind_gusts_10m",
-                "precipitation": "precipitation",
-                "precipitation_probability": "precipitation_probability",
-                "cloud_coverage": "cloud_cover",
-            }.items():
-                arr = hourly.get(src_key)
-                item[out_key] = arr[idx] if isinstance(arr, list) and idx < len(arr) else None
-
-            wcodes = hourly.get("weathercode")
-            if isinstance(wcodes, list) and idx < len(wcodes):
-                is_day_arr = hourly.get("is_day", [])
-                is_day_val = (
-                    is_day_arr[idx]
-                    if isinstance(is_day_arr, list) and idx < len(is_day_arr)
-                    else 1
-                )
-                item["condition"] = _map_condition(wcodes[idx], is_day_val)
+            item: dict[str, Any] = {"datetime": iso}
+            for out_key, col in columns:
+                item[out_key] = col[pos] if pos < len(col) else None
+
+            if pos < len(wcodes):
+                is_day_val = _pick(is_day_col, pos) if is_day_col is not None else 1
+                item["condition"] = _map_condition(wcodes[pos], is_day_val)
             else:
                 item["condition"] = None
 
             result.append(item)
 
-        missing = sorted({key for entry in result for key, value in entry.items() if value is None})
-        if result:
-            _LOGGER.debug(
-                "Hourly forecast: %d entries from %s to %s; missing fields: %s",
-                len(result),
-                result[0]["datetime"],
-                result[-1]["datetime"],
-                ", ".join(missing) if missing else "none",
+        if _LOGGER.isEnabledFor(logging.DEBUG):
+            missing = sorted(
+                {key for entry in result for key, value in entry.items() if value is None}
             )
-        else:
-            _LOGGER.debug("Hourly forecast: 0 entries")
+            if result:
+                _LOGGER.debug(
+                    "Hourly forecast: %d entries from %s to %s; missing fields: %s",
+                    len(result),
+                    result[0]["datetime"],
+                    result[-1]["datetime"],
+                    ", ".join(missing) if missing else "none",
+                )
+            else:
+                _LOGGER.debug("Hourly forecast: 0 entries")
+        self._hourly_cache = (start_idx, result)
         return result
 
-    @property
-    def sunrise(self) -> datetime | None:
-        val = (self.coordinator.data or {}).get("daily", {}).get("sunrise", [None])[0]
-        if isinstance(val, str):
-            dt = dt_util.parse_datetime(val)
+    def _local_tz(self) -> Any:
+        """Return the HA time zone, resolved once per configured zone name."""
+        tz_name = self.hass.config.time_zone
+        if self._tz_cache is None or self._tz_cache[0] != tz_name:
+            self._tz_cache = (tz_name, dt_util.get_time_zone(tz_name) or dt_util.UTC)
+        return self._tz_cache[1]
+
+    def _daily_sun(self, key: str) -> datetime | None:
+        """Return today's sunrise/sunset in UTC, parsed once per coordinator update."""
+        if key in self._sun_cache:
+            dt = self._sun_cache[key]
         else:
-            dt = val
+            val = (self._daily.get(key) or [None])[0]
+            dt = dt_util.parse_datetime(val) if isinstance(val, str) else val
+            self._sun_cache[key] = dt
         if not dt:
             return None
         if dt.tzinfo is None:
-            tz = dt_util.get_time_zone(self.hass.config.time_zone) or dt_util.UTC
-            dt = dt.replace(tzinfo=tz)
+            dt = dt.replace(tzinfo=self._local_tz())
         return dt_util.as_utc(dt)
 
+    @property
+    def sunrise(self) -> datetime | None:
+        return self._daily_sun("sunrise")
+
     @property
     def sunset(self) -> datetime | None:
-        val = (self.coordinator.data or {}).get("daily", {}).get("sunset", [None])[0]
-        if isinstance(val, str):
-            dt = dt_util.parse_datetime(val)
-        else:
-            dt = val
-        if not dt:
-            return None
-        if dt.tzinfo is None:
-            tz = dt_util.get_time_zone(self.hass.config.time_zone) or dt_util.UTC
-            dt = dt.replace(tzinfo=tz)
-        return dt_util.as_utc(dt)
+        return self._daily_sun("sunset")
 
     @property
     def extra_state_attributes(self) -> dict[str, Any]:
+        data = self.coordinator.data or {}
         attrs: dict[str, Any] = {
-            "location_name": (self.coordinator.data or {}).get("location_name"),
+            "location_name": data.get("location_name"),
             "mode": self._mode,
             "min_track_interval": self._min_track_interval,
-            "last_location_update": (self.coordinator.data or {}).get(
-                "last_location_update"
-            ),
+            "last_location_update": data.get("last_location_update"),
             "provider": self._provider,
         }
         dew = self.native_dew_point
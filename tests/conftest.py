@@ -1,10 +1,68 @@
 from __future__ import annotations
 
-from pathlib import Path
-import sys
+import asyncio
+from typing import Any
 
-ROOT = Path(__file__).resolve().parents[1]
-if str(ROOT) not in sys.path:
-    sys.path.insert(0, str(ROOT))
+import pytest
+from homeassistant.util import dt as dt_util
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+from custom_components.openmeteo.const import (
+    CONF_LATITUDE,
+    CONF_LONGITUDE,
+    CONF_MODE,
+    DOMAIN,
+    MODE_STATIC,
+)
 
 pytest_plugins = "pytest_homeassistant_custom_component"
+
+
+_REAL_GET_TIME_ZONE = dt_util.get_time_zone
+
+
+@pytest.fixture(autouse=True, scope="session")
+def utc_time_zone():
+    """Resolve every time zone to UTC, including the one set up for `hass`."""
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr(dt_util, "get_time_zone", lambda _time_zone=None: dt_util.UTC)
+        yield
+
+
+@pytest.fixture
+def real_time_zones(monkeypatch):
+    """Undo `utc_time_zone` for one test that needs real zone offsets."""
+    monkeypatch.setattr(dt_util, "get_time_zone", _REAL_GET_TIME_ZONE)
+
+
+@pytest.fixture
+async def make_entry(hass):
+    """Return a factory that builds an Open-Meteo MockConfigEntry added to `hass`.
+
+    Without `data`, the entry is a static-mode entry at (`lat`, `lon`). Every
+    entry made is unloaded at teardown, even when the test fails early.
+    """
+    entries: list[MockConfigEntry] = []
+
+    def _make(
+        *,
+        lat: float = 50.0,
+        lon: float = 20.0,
+        mode: str = MODE_STATIC,
+        data: dict[str, Any] | None = None,
+        **kwargs: Any,
+    ) -> MockConfigEntry:
+        if data is None:
+            data = {CONF_MODE: mode, CONF_LATITUDE: lat, CONF_LONGITUDE: lon}
+        entry = MockConfigEntry(domain=DOMAIN, data=data, **{"options": {}, **kwargs})
+        entry.add_to_hass(hass)
+        entries.append(entry)
+        return entry
+
+    yield _make
+
+    results = await asyncio.gather(
+        *(hass.config_entries.async_unload(entry.entry_id) for entry in entries),
+        return_exceptions=True,
+    )
+    assert results == [True] * len(entries)
@@ -0,0 +1,55 @@
+import os
+
+from tools.add_spdx_headers import HEADER_BYTES, iter_py, process_file
+
+
+def test_process_file_is_idempotent(tmp_path):
+    path = tmp_path / "script.py"
+    path.write_bytes(b"#!/usr/bin/env python3\nprint(1)\n")
+
+    assert process_file(str(path)) is True
+    tagged = path.read_bytes()
+    assert tagged == b"#!/usr/bin/env python3\n" + HEADER_BYTES + b"print(1)\n"
+
+    assert process_file(str(path)) is False
+    assert path.read_bytes() == tagged
+
+
+def test_process_file_keeps_file_mode(tmp_path):
+    path = tmp_path / "script.py"
+    path.write_bytes(b"#!/usr/bin/env python3\nprint(1)\n")
+    path.chmod(0o755)
+
+    assert process_file(str(path)) is True
+
+    assert path.stat().st_mode & 0o777 == 0o755
+    assert not (tmp_path / "script.py.tmp").exists()
+
+
+def test_process_file_rewrites_symlink_target(tmp_path):
+    target = tmp_path / "target.py"
+    target.write_bytes(b"x = 1\n")
+    link = tmp_path / "link.py"
+    link.symlink_to(target)
+
+    assert process_file(str(link)) is True
+
+    assert link.is_symlink()
+    assert target.read_bytes() == HEADER_BYTES + b"x = 1\n"
+
+
+def test_iter_py_skips_unreadable_directories(tmp_path, monkeypatch):
+    (tmp_path / "ok.py").write_bytes(b"x = 1\n")
+    locked = tmp_path / "locked"
+    locked.mkdir()
+    (locked / "hidden.py").write_bytes(b"x = 1\n")
+    real_scandir = os.scandir
+
+    def _scandir(path):
+        if os.fspath(path) == str(locked):
+            raise PermissionError(13, "Permission denied", path)
+        return real_scandir(path)
+
+    monkeypatch.setattr(os, "scandir", _scandir)
+
+    assert list(iter_py(str(tmp_path))) == [str(tmp_path / "ok.py")]
@@ -0,0 +1,73 @@
+from __future__ import annotations
+
+from datetime import datetime, timedelta
+
+import pytest
+from homeassistant.util import dt as dt_util
+
+from custom_components.openmeteo.helpers import (
+    hourly_at_now,
+    hourly_epochs,
+    hourly_index_at_now,
+)
+
+NOW = datetime(2024, 1, 1, 12, tzinfo=dt_util.UTC)
+
+
+@pytest.fixture(autouse=True)
+def _frozen_now(freezer):
+    """Pin the clock so the grid and the lookup see the same hour."""
+    freezer.move_to(NOW)
+
+
+def _hour_grid(start, count: int) -> list[str]:
+    return [(start + timedelta(hours=i)).strftime("%Y-%m-%dT%H:%M") for i in range(count)]
+
+
+def test_hourly_index_on_contiguous_grid() -> None:
+    times = _hour_grid(NOW - timedelta(hours=5), 48)
+    data = {"timezone": "UTC", "hourly": {"time": times, "temperature_2m": list(range(48))}}
+
+    assert hourly_index_at_now(data) == 5
+    assert hourly_at_now(data, "temperature_2m") == 5
+
+
+def test_hourly_index_falls_back_to_nearest_on_gap() -> None:
+    times = _hour_grid(NOW - timedelta(hours=5), 48)
+    # Drop an hour before "now" so the 1-hour grid assumption breaks.
+    del times[2]
+    data = {"timezone": "UTC", "hourly": {"time": times}}
+
+    assert hourly_index_at_now(data) == 4
+
+
+def test_hourly_index_outside_range_uses_nearest() -> None:
+    times = _hour_grid(NOW + timedelta(hours=3), 24)
+    data = {"timezone": "UTC", "hourly": {"time": times}}
+
+    assert hourly_index_at_now(data) == 0
+
+
+def test_hourly_index_reuses_precomputed_epochs() -> None:
+    times = _hour_grid(NOW - timedelta(hours=5), 48)
+    del times[2]
+    times[0] = "garbage"
+    data = {"timezone": "UTC", "hourly": {"time": times}}
+
+    epochs, indices = hourly_epochs(data)
+    assert 0 not in indices
+    assert len(epochs) == len(times) - 1
+    assert hourly_index_at_now(data, (epochs, indices)) == 4
+
+
+def test_hourly_index_grid_shortcut_skips_epoch_parse() -> None:
+    times = _hour_grid(NOW - timedelta(hours=5), 48)
+    data = {"timezone": "UTC", "hourly": {"time": times}}
+
+    def _unused_epochs():
+        raise AssertionError("epochs parsed on a clean 1-hour grid")
+
+    assert hourly_index_at_now(data, _unused_epochs) == 5
+
+    del times[2]
+    assert hourly_index_at_now(data, lambda: hourly_epochs(data)) == 4
@@ -1,8 +1,6 @@
 from types import SimpleNamespace
 from unittest.mock import MagicMock
 
-import pytest
-
 from custom_components.openmeteo.__init__ import async_migrate_entry
 from custom_components.openmeteo.const import (
     CONF_API_PROVIDER,
@@ -17,7 +15,6 @@ from custom_components.openmeteo.const import (
 )
 
 
-@pytest.mark.asyncio
 async def test_migration_uses_async_update_entry_for_version() -> None:
     entry = SimpleNamespace(
         data={"pv_legacy": 1},
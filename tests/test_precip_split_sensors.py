@@ -1,6 +1,7 @@
-def test_precipitation_split_current_hour_values():
-    from custom_components.openmeteo.sensor import SENSOR_TYPES
+from custom_components.openmeteo.sensor import SENSOR_TYPES
+
 
+def test_precipitation_split_current_hour_values():
     data = {
         "timezone": "UTC",
         "hourly": {
@@ -17,13 +18,8 @@ def test_precipitation_split_current_hour_values():
 
 
 def test_precipitation_sum_display_name():
-    from custom_components.openmeteo.sensor import SENSOR_TYPES
-
     assert SENSOR_TYPES["precipitation_sum"].name == "Opad łączny (bieżąca godzina)"
 
 
 def test_no_legacy_generation_sensors_present():
-    from custom_components.openmeteo.sensor import SENSOR_TYPES
-
-    for key in SENSOR_TYPES:
-        assert not key.startswith("p" + "v_")
+    assert not [k for k in SENSOR_TYPES if k.startswith("p" + "v_")]
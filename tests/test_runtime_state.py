@@ -3,8 +3,6 @@ from __future__ import annotations
 from types import SimpleNamespace
 from unittest.mock import AsyncMock
 
-import pytest
-
 from custom_components.openmeteo import async_update_entry
 from custom_components.openmeteo.const import DOMAIN
 from custom_components.openmeteo.runtime import (
@@ -14,7 +12,6 @@ from custom_components.openmeteo.runtime import (
 )
 
 
-@pytest.mark.asyncio
 async def test_get_entry_coordinator_supports_canonical_and_wrapped_shape() -> None:
     hass = SimpleNamespace(data={DOMAIN: {"entry_a": "coord_a", "entry_b": {"coordinator": "coord_b"}}})
 
@@ -22,7 +19,6 @@ async def test_get_entry_coordinator_supports_canonical_and_wrapped_shape() -> N
     assert get_entry_coordinator(hass, "entry_b") == "coord_b"
 
 
-@pytest.mark.asyncio
 async def test_runtime_store_create_and_read_consistent() -> None:
     hass = SimpleNamespace(data={})
 
@@ -35,7 +31,6 @@ async def test_runtime_store_create_and_read_consistent() -> None:
     assert resolved == {"src": "forecast"}
 
 
-@pytest.mark.asyncio
 async def test_async_update_entry_uses_wrapped_coordinator_without_reload() -> None:
     coordinator = SimpleNamespace(consume_suppress_reload=lambda: True)
     entry = SimpleNamespace(entry_id="entry_wrapped")
@@ -0,0 +1,101 @@
+from __future__ import annotations
+
+from datetime import datetime, timedelta
+from types import SimpleNamespace
+
+from homeassistant.util import dt as dt_util
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+from custom_components.openmeteo.const import (
+    CONF_LATITUDE,
+    CONF_LONGITUDE,
+    CONF_MODE,
+    DOMAIN,
+    MODE_STATIC,
+)
+from custom_components.openmeteo.weather import OpenMeteoWeather
+
+
+def _daily_payload(codes: list[int]) -> dict:
+    return {
+        "daily": {
+            "time": ["2024-01-01", "2024-01-02"],
+            "temperature_2m_max": [5.0, 6.0],
+            "temperature_2m_min": [-1.0],
+            "weathercode": codes,
+        }
+    }
+
+
+def _weather(data: dict) -> tuple[OpenMeteoWeather, SimpleNamespace]:
+    entry = MockConfigEntry(
+        domain=DOMAIN,
+        data={CONF_MODE: MODE_STATIC, CONF_LATITUDE: 50.0, CONF_LONGITUDE: 20.0},
+        options={},
+        title="Test",
+    )
+    coordinator = SimpleNamespace(
+        hass=None, data=data, last_update_success=True, provider="Open-Meteo"
+    )
+    return OpenMeteoWeather(coordinator, entry), coordinator
+
+
+def test_daily_forecast_rows_and_cache() -> None:
+    weather, coordinator = _weather(_daily_payload([0, 61]))
+
+    forecast = weather.forecast_daily
+    assert [row["condition"] for row in forecast] == ["sunny", "rainy"]
+    assert forecast[0]["templow"] == -1.0
+    assert forecast[1]["templow"] is None
+    assert forecast[1]["wind_bearing"] is None
+    # Same coordinator payload -> same list object
+    assert weather.forecast_daily is forecast
+
+    coordinator.data = _daily_payload([3, 3])
+    # Cached rows follow the cached sections, which refresh with the coordinator
+    assert weather.forecast_daily is forecast
+    weather._cache_coordinator_data()
+    refreshed = weather.forecast_daily
+    assert refreshed is not forecast
+    assert [row["condition"] for row in refreshed] == ["cloudy", "cloudy"]
+
+
+async def test_hourly_forecast_window_and_cache(freezer) -> None:
+    now = datetime(2024, 1, 1, 12, tzinfo=dt_util.UTC)
+    freezer.move_to(now)
+    times = [
+        (now + timedelta(hours=i - 2)).strftime("%Y-%m-%dT%H:%M") for i in range(100)
+    ]
+    weather, _ = _weather(
+        {
+            "timezone": "UTC",
+            "hourly": {
+                "time": times,
+                "temperature_2m": list(range(100)),
+                "weathercode": [0] * 3,
+                "is_day": [1, 1, 0],
+                "cloud_cover": "invalid",
+            },
+        }
+    )
+
+    forecast = await weather.async_forecast_hourly()
+    assert len(forecast) == 72
+    assert forecast[0]["temperature"] == 2
+    assert forecast[0]["condition"] == "clear-night"
+    assert forecast[0]["cloud_coverage"] is None
+    assert forecast[1]["condition"] is None
+    assert await weather.async_forecast_hourly() is forecast
+
+
+def test_hour_index_advances_on_half_hour_offset_zone(freezer, real_time_zones) -> None:
+    # 12:00 UTC is 17:30 in Asia/Kolkata (UTC+05:30)
+    freezer.move_to(datetime(2024, 1, 1, 12, tzinfo=dt_util.UTC))
+    times = [f"2024-01-01T{hour:02d}:00" for hour in range(12, 24)]
+    weather, _ = _weather({"timezone": "Asia/Kolkata", "hourly": {"time": times}})
+
+    assert weather._hour_index() == 5
+
+    # 18:00 local: a new 15-minute slot, so the memoized index moves on
+    freezer.tick(timedelta(minutes=30))
+    assert weather._hour_index() == 6
@@ -1,40 +1,76 @@
 #!/usr/bin/env python3
 # SPDX-License-Identifier: Apache-2.0
-# SPDX-License-Identifier: Apache-2.0
 
-import os, sys, io
+import os, sys, shutil
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
 
 HEADER = "# SPDX-License-Identifier: Apache-2.0\n"
+HEADER_BYTES = HEADER.encode("utf-8")
+MARKER = b"SPDX-License-Identifier: Apache-2.0"
+SHEBANG = b"#!"
 
 def process_file(path: str):
-    with open(path, "r", encoding="utf-8") as f:
-        content = f.read()
-    # if header already present, skip
-    if "SPDX-License-Identifier: Apache-2.0" in content.splitlines()[:5]:
-        return False
+    # rewrite a symlink's target, not the link itself
+    path = os.path.realpath(path)
+    # only the head is needed to decide; skipped files are never rewritten
+    with open(path, "rb") as f:
+        head = f.read(4096)
+        # if header already present, skip
+        if head.find(MARKER, 0, 512) != -1:
+            return False
+        content = head + f.read()
     # insert after shebang if present, else at top
-    lines = content.splitlines(True)
-    if lines and lines[0].startswith("#!"):
-        lines.insert(1, HEADER)
-    else:
-        lines.insert(0, HEADER)
-    with open(path, "w", encoding="utf-8") as f:
-        f.writelines(lines)
+    nl = 0
+    if content.startswith(SHEBANG):
+        nl = content.find(b"\n") + 1 or len(content)
+    tmp = Path(path + ".tmp")
+    try:
+        tmp.write_bytes(content[:nl] + HEADER_BYTES + content[nl:])
+        # keep the executable bit on shebang scripts
+        shutil.copymode(path, tmp)
+        os.replace(tmp, path)
+    finally:
+        # no-op after a successful replace; drops a partial write otherwise
+        tmp.unlink(missing_ok=True)
     return True
 
+def iter_py(root: str):
+    # DirEntry caches the type from scandir, so no extra stat per entry
+    try:
+        it = os.scandir(root)
+    except OSError:
+        # unreadable directory: skip it, as os.walk did
+        return
+    with it:
+        for e in it:
+            if e.is_dir(follow_symlinks=False):
+                yield from iter_py(e.path)
+            elif e.name.endswith(".py") and e.is_file():
+                yield e.path
+
+def _try_process(path: str):
+    try:
+        return path, process_file(path), None
+    except Exception as e:
+        return path, False, e
+
 def main():
     root = sys.argv[1] if len(sys.argv) > 1 else "."
+    # a link and its target must not be rewritten by two workers at once
+    paths = {}
+    for p in iter_py(root):
+        paths.setdefault(os.path.realpath(p), p)
     changed = 0
-    for dirpath, _, filenames in os.walk(root):
-        for name in filenames:
-            if name.endswith(".py"):
-                p = os.path.join(dirpath, name)
-                try:
-                    if process_file(p):
-                        changed += 1
-                        print(f"added SPDX to: {p}")
-                except Exception as e:
-                    print(f"skip {p}: {e}")
+    # I/O bound: overlap the blocking reads/writes, print once the pool drains
+    with ThreadPoolExecutor(max_workers=min(32, (os.cpu_count() or 1) * 4)) as ex:
+        results = list(ex.map(_try_process, paths.values()))
+    for p, did_change, err in results:
+        if err is not None:
+            print(f"skip {p}: {err}")
+        elif did_change:
+            changed += 1
+            print(f"added SPDX to: {p}")
     print(f"done. changed {changed} files.")
 
 if __name__ == "__main__":